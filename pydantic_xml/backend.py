@@ -1,9 +1,140 @@
+import threading
+from typing import IO, Any, Iterator, List, Union
+
 from . import config
 
 if config.FORCE_STD_XML:
     import xml.etree.ElementTree as etree
+    is_lxml = False
 else:
     try:
         from lxml import etree  # type: ignore[no-redef]
+        is_lxml = True
     except ImportError:
         import xml.etree.ElementTree as etree  # noqa: F401
+        is_lxml = False
+
+
+Element = etree.Element
+tostring = etree.tostring
+
+
+if is_lxml:
+    # lxml parsers are not thread-safe so every thread gets its own one
+    _parser_storage = threading.local()
+
+    def _get_parser() -> Any:
+        if (parser := getattr(_parser_storage, 'parser', None)) is None:
+            parser = _parser_storage.parser = etree.XMLParser(  # type: ignore[call-arg]
+                huge_tree=False,
+                resolve_entities=False,
+                collect_ids=False,
+            )
+
+        return parser
+
+    def _get_str_parser() -> Any:
+        # decoded strings are re-encoded to utf-8, so the document encoding declaration is ignored
+        if (parser := getattr(_parser_storage, 'str_parser', None)) is None:
+            parser = _parser_storage.str_parser = etree.XMLParser(  # type: ignore[call-arg]
+                encoding='utf-8',
+                huge_tree=False,
+                resolve_entities=False,
+                collect_ids=False,
+            )
+
+        return parser
+
+    def fromstring(source: Union[str, bytes]) -> etree.Element:
+        """
+        Parses an xml document from a string reusing the thread parser.
+
+        :param source: xml string
+        :return: document root element
+        """
+
+        return etree.fromstring(source, parser=_get_parser())
+
+    def fromstring_str(source: str) -> etree.Element:
+        """
+        Parses an xml document from a decoded string reusing the thread parser.
+        Unlike `fromstring` accepts documents with an encoding declaration.
+
+        :param source: xml string
+        :return: document root element
+        """
+
+        return etree.fromstring(source.encode(), parser=_get_str_parser())
+
+    def iterparse(source: Union[str, IO[bytes]], tag: str) -> Iterator[etree.Element]:
+        """
+        Incrementally parses an xml document yielding the elements with the provided tag.
+        Elements nested in an element with the same tag are not yielded separately.
+        A yielded element and its preceding siblings are dropped from the tree
+        once the consumer requests the next one.
+
+        :param source: xml file name or file object
+        :param tag: tag of the elements to be yielded
+        :return: elements iterator
+        """
+
+        events = etree.iterparse(  # type: ignore[call-arg]
+            source,
+            events=('start', 'end'),
+            tag=tag,
+            huge_tree=False,
+            resolve_entities=False,
+            collect_ids=False,
+        )
+        depth = 0
+        for event, element in events:
+            if event == 'start':
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 0:
+                continue
+
+            yield element
+
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+else:
+    fromstring = etree.fromstring  # type: ignore[assignment]
+    fromstring_str = etree.fromstring  # type: ignore[assignment]
+
+    def iterparse(source: Union[str, IO[bytes]], tag: str) -> Iterator[etree.Element]:
+        """
+        Incrementally parses an xml document yielding the elements with the provided tag.
+        Elements nested in an element with the same tag are not yielded separately.
+        A yielded element is dropped from the tree once the consumer requests the next one.
+
+        :param source: xml file name or file object
+        :param tag: tag of the elements to be yielded
+        :return: elements iterator
+        """
+
+        parents: List[etree.Element] = []
+        depth = 0
+        for event, element in etree.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                parents.append(element)
+                if element.tag == tag:
+                    depth += 1
+                continue
+
+            parents.pop()
+            if element.tag != tag:
+                continue
+
+            depth -= 1
+            if depth != 0:
+                continue
+
+            yield element
+
+            if parents:
+                parents[-1].remove(element)
@@ -1,12 +1,40 @@
-from typing import Any, ClassVar, Dict, Optional, Tuple, Type, Union
+import dataclasses as dc
+import weakref
+from inspect import isclass
+from sys import intern
+from typing import IO, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+from typing import get_args
 
 import pydantic as pd
 import pydantic.fields
 import pydantic.generics
+import pydantic.typing
 
-from . import config, errors, serializers
+from . import backend, config, errors, serializers
 from .backend import etree
-from .utils import NsMap, register_nsmap
+from .utils import NsMap, NsMapItems, freeze_nsmap, register_nsmap_items
+
+_REGISTER_NS_PREFIXES = config.REGISTER_NS_PREFIXES
+_DEFAULT_ENCODER = serializers.DEFAULT_ENCODER
+_fromstring = backend.fromstring
+_fromstring_str = backend.fromstring_str
+_tostring = backend.tostring
+_iterparse = backend.iterparse
+
+
+def refresh_backend() -> None:
+    """
+    Rebinds the module xml backend and default encoder shortcuts.
+    Should be called after `backend` or `serializers.DEFAULT_ENCODER` are patched.
+    """
+
+    global _DEFAULT_ENCODER, _fromstring, _fromstring_str, _tostring, _iterparse
+
+    _DEFAULT_ENCODER = serializers.DEFAULT_ENCODER
+    _fromstring = backend.fromstring
+    _fromstring_str = backend.fromstring_str
+    _tostring = backend.tostring
+    _iterparse = backend.iterparse
 
 
 class XmlEntityInfo(pd.fields.FieldInfo):
@@ -14,6 +42,18 @@ class XmlEntityInfo(pd.fields.FieldInfo):
     Field xml meta-information.
     """
 
+    __slots__: Tuple[str, ...] = ()
+
+    def __repr_args__(self) -> 'pd.typing.ReprArgs':
+        # pydantic represents only the attributes listed in the most derived class `__slots__`
+        field_defaults = {'repr': True, **self.__field_constraints__}
+        field_args = ((name, getattr(self, name)) for name in pd.fields.FieldInfo.__slots__)
+
+        return [
+            *((name, value) for name, value in field_args if value != field_defaults.get(name, None)),
+            *((name, getattr(self, name)) for name in self.__slots__),
+        ]
+
 
 class XmlAttributeInfo(XmlEntityInfo):
     """
@@ -24,6 +64,8 @@ class XmlAttributeInfo(XmlEntityInfo):
     :param kwargs: pydantic field arguments
     """
 
+    __slots__ = ('name', 'ns')
+
     def __init__(
             self,
             name: Optional[str] = None,
@@ -31,16 +73,8 @@ class XmlAttributeInfo(XmlEntityInfo):
             **kwargs: Any,
     ):
         super().__init__(**kwargs)
-        self._name = name
-        self._ns = ns
-
-    @property
-    def name(self) -> Optional[str]:
-        return self._name
-
-    @property
-    def ns(self) -> Optional[str]:
-        return self._ns
+        self.name = intern(name) if name is not None else None
+        self.ns = intern(ns) if ns is not None else None
 
 
 class XmlElementInfo(XmlEntityInfo):
@@ -53,6 +87,8 @@ class XmlElementInfo(XmlEntityInfo):
     :param kwargs: pydantic field arguments
     """
 
+    __slots__ = ('tag', 'ns', 'nsmap')
+
     def __init__(
             self,
             tag: Optional[str] = None,
@@ -61,24 +97,12 @@ class XmlElementInfo(XmlEntityInfo):
             **kwargs: Any,
     ):
         super().__init__(**kwargs)
-        self._tag = tag
-        self._ns = ns
-        self._nsmap = nsmap
-
-        if config.REGISTER_NS_PREFIXES and nsmap:
-            register_nsmap(nsmap)
-
-    @property
-    def tag(self) -> Optional[str]:
-        return self._tag
+        self.tag = intern(tag) if tag is not None else None
+        self.ns = intern(ns) if ns is not None else None
+        self.nsmap = nsmap
 
-    @property
-    def ns(self) -> Optional[str]:
-        return self._ns
-
-    @property
-    def nsmap(self) -> Optional[NsMap]:
-        return self._nsmap
+        if _REGISTER_NS_PREFIXES and (nsmap_items := freeze_nsmap(nsmap)):
+            register_nsmap_items(nsmap_items)
 
 
 class XmlWrapperInfo(XmlEntityInfo):
@@ -92,6 +116,8 @@ class XmlWrapperInfo(XmlEntityInfo):
     :param kwargs: pydantic field arguments
     """
 
+    __slots__ = ('entity', 'path', 'ns', 'nsmap')
+
     def __init__(
             self,
             path: str,
@@ -101,29 +127,13 @@ class XmlWrapperInfo(XmlEntityInfo):
             **kwargs: Any,
     ):
         super().__init__(**kwargs)
-        self._entity = entity
-        self._path = path
-        self._ns = ns
-        self._nsmap = nsmap
-
-        if config.REGISTER_NS_PREFIXES and nsmap:
-            register_nsmap(nsmap)
-
-    @property
-    def entity(self) -> Optional[XmlEntityInfo]:
-        return self._entity
-
-    @property
-    def path(self) -> str:
-        return self._path
+        self.entity = entity
+        self.path = intern(path)
+        self.ns = intern(ns) if ns is not None else None
+        self.nsmap = nsmap
 
-    @property
-    def ns(self) -> Optional[str]:
-        return self._ns
-
-    @property
-    def nsmap(self) -> Optional[NsMap]:
-        return self._nsmap
+        if _REGISTER_NS_PREFIXES and (nsmap_items := freeze_nsmap(nsmap)):
+            register_nsmap_items(nsmap_items)
 
 
 def attr(**kwargs: Any) -> XmlAttributeInfo:
@@ -150,6 +160,73 @@ def wrapped(*args: Any, **kwargs: Any) -> XmlWrapperInfo:
     return XmlWrapperInfo(*args, **kwargs)
 
 
+@dc.dataclass(frozen=True)
+class XmlMeta:
+    """
+    Model xml meta-information.
+
+    :param tag: element tag
+    :param ns: element namespace
+    :param nsmap: element namespace map
+    :param nsmap_items: frozen element namespace map items
+    :param default_ns: element default namespace
+    :param ns_attrs: use namespaced attributes
+    :param skip_validation: construct deserialized objects without pydantic validation
+    :param serializer: model root serializer
+    :param parse_obj: function creating a model object from the deserialized data
+    :param ready: model serializer is initialized
+    """
+
+    tag: Optional[str] = None
+    ns: Optional[str] = None
+    nsmap: Optional[NsMap] = None
+    nsmap_items: Optional[NsMapItems] = None
+    default_ns: Optional[str] = None
+    ns_attrs: bool = False
+    skip_validation: bool = False
+    serializer: Optional[serializers.ModelSerializerFactory.RootSerializer] = None
+    parse_obj: Optional[Callable[[Any], 'BaseXmlModel']] = None
+    ready: bool = False
+
+
+def _build_field_factory(model_field: pd.fields.ModelField) -> Optional[Callable[[Any], Any]]:
+    """
+    Builds a function creating sub-model objects of a field from the deserialized field data.
+
+    :param model_field: model field
+    :return: field factory or `None` if the field doesn't contain sub-models
+    """
+
+    shape_type = serializers.PydanticShapeType.from_shape(model_field.shape)
+    if shape_type is serializers.PydanticShapeType.SCALAR:
+        field_type = model_field.type_
+        if isclass(field_type) and issubclass(field_type, BaseXmlModel):
+            # the sub-model factory is resolved on call since self-referencing models are partially initialized here
+            return lambda obj: field_type.__xml_meta__.parse_obj(obj)
+
+    elif shape_type is serializers.PydanticShapeType.HOMOGENEOUS:
+        assert model_field.sub_fields is not None, "unexpected model field"
+        if (item_factory := _build_field_factory(model_field.sub_fields[0])) is not None:
+            factory = item_factory
+            return lambda objs: [factory(obj) if obj is not None else None for obj in objs]
+
+    elif shape_type is serializers.PydanticShapeType.HETEROGENEOUS:
+        assert model_field.sub_fields is not None, "unexpected model field"
+        item_factories = [_build_field_factory(item_field) for item_field in model_field.sub_fields]
+        if any(item_factory is not None for item_factory in item_factories):
+            return lambda objs: [
+                item_factory(obj) if item_factory is not None and obj is not None else obj
+                for item_factory, obj in zip(item_factories, objs)
+            ]
+
+    return None
+
+
+_REGISTERED_MODELS: 'weakref.WeakSet[Type[BaseXmlModel]]' = weakref.WeakSet()
+# library base models are not exposed as registered ones
+_LIBRARY_MODELS = frozenset(('BaseXmlModel', 'BaseGenericXmlModel'))
+
+
 class XmlModelMeta(pd.main.ModelMetaclass):
 
     __is_base_model_defined__ = False
@@ -158,6 +235,8 @@ class XmlModelMeta(pd.main.ModelMetaclass):
         cls = super().__new__(mcls, name, bases, namespace, **kwargs)
         if mcls.__is_base_model_defined__:
             cls.__init_serializer__()
+            if not (namespace.get('__module__') == __name__ and name in _LIBRARY_MODELS):
+                _REGISTERED_MODELS.add(cls)
         else:
             mcls.__is_base_model_defined__ = True
 
@@ -169,11 +248,7 @@ class BaseXmlModel(pd.BaseModel, metaclass=XmlModelMeta):
     Base pydantic-xml model.
     """
 
-    __xml_tag__: ClassVar[Optional[str]]
-    __xml_ns__: ClassVar[Optional[str]]
-    __xml_nsmap__: ClassVar[Optional[NsMap]]
-    __xml_ns_attrs__: ClassVar[bool]
-    __xml_serializer__: ClassVar[Optional[serializers.ModelSerializerFactory.RootSerializer]]
+    __xml_meta__: ClassVar[XmlMeta] = XmlMeta()
 
     def __init_subclass__(
             cls,
@@ -182,6 +257,7 @@ class BaseXmlModel(pd.BaseModel, metaclass=XmlModelMeta):
             ns: Optional[str] = None,
             nsmap: Optional[NsMap] = None,
             ns_attrs: bool = False,
+            skip_validation: bool = False,
             **kwargs: Any,
     ):
         """
@@ -191,21 +267,77 @@ class BaseXmlModel(pd.BaseModel, metaclass=XmlModelMeta):
         :param ns: element namespace
         :param nsmap: element namespace map
         :param ns_attrs: use namespaced attributes
+        :param skip_validation: construct deserialized objects without pydantic validation.
+                                Primitive field values are left as strings extracted from the document,
+                                sub-models are created by their own models.
         """
 
         super().__init_subclass__(*args, **kwargs)
 
-        cls.__xml_tag__ = tag
-        cls.__xml_ns__ = ns
-        cls.__xml_nsmap__ = nsmap
-        cls.__xml_ns_attrs__ = ns_attrs
+        cls.__xml_meta__ = XmlMeta(
+            tag=intern(tag) if tag is not None else None,
+            ns=intern(ns) if ns is not None else None,
+            nsmap=nsmap,
+            nsmap_items=freeze_nsmap(nsmap),
+            default_ns=(nsmap.get('') or None) if nsmap else None,
+            ns_attrs=ns_attrs,
+            skip_validation=skip_validation,
+        )
 
     @classmethod
     def __init_serializer__(cls) -> None:
-        if config.REGISTER_NS_PREFIXES and cls.__xml_nsmap__:
-            register_nsmap(cls.__xml_nsmap__)
+        if _REGISTER_NS_PREFIXES and (nsmap_items := cls.__xml_meta__.nsmap_items):
+            register_nsmap_items(nsmap_items)
+
+        cls.__xml_meta__ = dc.replace(
+            cls.__xml_meta__,
+            serializer=serializers.ModelSerializerFactory.from_model(cls),
+            parse_obj=cls.__build_parse_obj__(),
+            ready=True,
+        )
 
-        cls.__xml_serializer__ = serializers.ModelSerializerFactory.from_model(cls)
+    @classmethod
+    def __build_parse_obj__(cls) -> Callable[[Any], 'BaseXmlModel']:
+        """
+        Builds a function creating an object of `cls` type from the data deserialized by the model serializer.
+        Validated models are created by `parse_obj` (so its overrides are respected),
+        models without validation are constructed creating sub-model objects by their own factories.
+        """
+
+        if not cls.__xml_meta__.skip_validation:
+            return cls.parse_obj
+
+        field_factories = {
+            field_name: field_factory
+            for field_name, model_field in cls.__fields__.items()
+            if (field_factory := _build_field_factory(model_field)) is not None
+        }
+
+        factory: Callable[..., 'BaseXmlModel']
+        if field_factories:
+            construct = cls.construct
+
+            def factory(**obj: Any) -> 'BaseXmlModel':
+                for field_name, field_factory in field_factories.items():
+                    if (value := obj.get(field_name)) is not None:
+                        obj[field_name] = field_factory(value)
+
+                return construct(**obj)
+        else:
+            factory = cls.construct
+
+        if cls.__custom_root_type__:
+            return lambda obj: factory(__root__=obj)
+        else:
+            return lambda obj: factory(**obj)
+
+    @classmethod
+    def __xml_not_ready_error__(cls) -> errors.ModelError:
+        """
+        Builds the error raised when the model is used before its serializer is initialized.
+        """
+
+        return errors.ModelError(f"{cls.__name__} model is partially initialized")
 
     @classmethod
     def from_xml_tree(cls, root: etree.Element) -> 'BaseXmlModel':
@@ -216,10 +348,13 @@ class BaseXmlModel(pd.BaseModel, metaclass=XmlModelMeta):
         :return: deserialized object
         """
 
-        assert cls.__xml_serializer__ is not None, "model is partially initialized"
-        obj = cls.__xml_serializer__.deserialize(root)
+        meta = cls.__xml_meta__
+        if not meta.ready:
+            raise cls.__xml_not_ready_error__()
 
-        return cls.parse_obj(obj)
+        obj = meta.serializer.deserialize(root)  # type: ignore[union-attr]
+
+        return meta.parse_obj(obj)  # type: ignore[misc]
 
     @classmethod
     def from_xml(cls, source: Union[str, bytes]) -> 'BaseXmlModel':
@@ -230,7 +365,92 @@ class BaseXmlModel(pd.BaseModel, metaclass=XmlModelMeta):
         :return: deserialized object
         """
 
-        return cls.from_xml_tree(etree.fromstring(source))
+        if isinstance(source, str):
+            return cls.from_xml_str(source)
+        else:
+            return cls.from_xml_bytes(source)
+
+    @classmethod
+    def from_xml_bytes(cls, source: bytes) -> 'BaseXmlModel':
+        """
+        Deserializes an encoded xml document to an object of `cls` type.
+
+        :param source: xml document bytes
+        :return: deserialized object
+        """
+
+        if not cls.__xml_meta__.ready:
+            raise cls.__xml_not_ready_error__()
+
+        return cls.from_xml_tree(_fromstring(source))
+
+    @classmethod
+    def from_xml_str(cls, source: str) -> 'BaseXmlModel':
+        """
+        Deserializes a decoded xml document to an object of `cls` type.
+        The document encoding declaration (if any) is ignored.
+
+        :param source: xml string
+        :return: deserialized object
+        """
+
+        if not cls.__xml_meta__.ready:
+            raise cls.__xml_not_ready_error__()
+
+        return cls.from_xml_tree(_fromstring_str(source))
+
+    @classmethod
+    def from_xml_many(cls, sources: Iterable[Union[str, bytes]]) -> List['BaseXmlModel']:
+        """
+        Deserializes multiple xml strings to objects of `cls` type.
+        The model readiness is checked once for the whole batch.
+        The documents are deserialized by the model serializer directly,
+        so `from_xml_tree` overrides are not called. The objects are created the same way
+        as by `from_xml_tree` (by `parse_obj` or `construct` for models without validation).
+
+        :param sources: xml strings
+        :return: deserialized objects
+        """
+
+        meta = cls.__xml_meta__
+        if not meta.ready:
+            raise cls.__xml_not_ready_error__()
+
+        serializer, parse_obj = meta.serializer, meta.parse_obj
+
+        return [
+            parse_obj(  # type: ignore[misc]
+                serializer.deserialize(  # type: ignore[union-attr]
+                    _fromstring_str(source) if isinstance(source, str) else _fromstring(source),
+                ),
+            )
+            for source in sources
+        ]
+
+    @classmethod
+    def from_xml_stream(
+            cls,
+            source: Union[str, IO[bytes]],
+            tag: Optional[str] = None,
+    ) -> Iterator['BaseXmlModel']:
+        """
+        Incrementally deserializes objects of `cls` type from an xml document.
+        Every element with the provided tag is deserialized as soon as it is parsed
+        and then dropped from the tree so that the memory consumption doesn't depend on the number of records.
+
+        :param source: xml file name or file object
+        :param tag: tag of the elements the objects are deserialized from (`{namespace}tag` for namespaced elements),
+                    the model element name is used by default
+        :return: deserialized objects iterator
+        """
+
+        if not cls.__xml_meta__.ready:
+            raise cls.__xml_not_ready_error__()
+
+        if tag is None:
+            tag = cls.__xml_meta__.serializer.element_name  # type: ignore[union-attr]
+
+        return (cls.from_xml_tree(element) for element in _iterparse(source, tag))
 
     def to_xml_tree(
             self,
@@ -246,16 +466,16 @@ class BaseXmlModel(pd.BaseModel, metaclass=XmlModelMeta):
         :return: object xml representation
         """
 
-        encoder = encoder or serializers.DEFAULT_ENCODER
-
-        assert self.__xml_serializer__ is not None
-        root = self.__xml_serializer__.serialize(None, self, encoder=encoder, skip_empty=skip_empty)
-        assert root is not None
+        meta = self.__xml_meta__
+        if not meta.ready:
+            raise self.__xml_not_ready_error__()
 
-        if self.__xml_nsmap__ and (default_ns := self.__xml_nsmap__.get('')):
-            root.set('xmlns', default_ns)
+        encoder = encoder if encoder is not None else _DEFAULT_ENCODER
 
-        return root
+        # the serializer is always set for models that passed the readiness check
+        return meta.serializer.serialize(  # type: ignore[union-attr, return-value]
+            None, self, encoder=encoder, skip_empty=skip_empty,
+        )
 
     def to_xml(
             self,
@@ -273,7 +493,98 @@ class BaseXmlModel(pd.BaseModel, metaclass=XmlModelMeta):
         :return: object xml representation
         """
 
-        return etree.tostring(self.to_xml_tree(encoder=encoder, skip_empty=skip_empty), **kwargs)
+        if not self.__xml_meta__.ready:
+            raise self.__xml_not_ready_error__()
+
+        return _tostring(self.to_xml_tree(encoder=encoder, skip_empty=skip_empty), **kwargs)
+
+    def to_xml_bytes(
+            self,
+            *,
+            encoder: Optional[serializers.XmlEncoder] = None,
+            skip_empty: bool = False,
+            **kwargs: Any,
+    ) -> bytes:
+        """
+        Serializes the object to an encoded xml document.
+
+        :param encoder: xml type encoder
+        :param skip_empty: skip empty elements (elements without sub-elements, attributes and text, Nones)
+        :param kwargs: additional xml serialization arguments (except `encoding='unicode'`)
+        :return: object xml representation
+        """
+
+        encoding = kwargs.get('encoding')
+        if encoding is str or (isinstance(encoding, str) and encoding.lower() == 'unicode'):
+            raise ValueError("unicode encoding is not supported, use to_xml_str instead")
+
+        xml = self.to_xml(encoder=encoder, skip_empty=skip_empty, **kwargs)
+        assert isinstance(xml, bytes)
+
+        return xml
+
+    def to_xml_str(
+            self,
+            *,
+            encoder: Optional[serializers.XmlEncoder] = None,
+            skip_empty: bool = False,
+            **kwargs: Any,
+    ) -> str:
+        """
+        Serializes the object to a decoded xml string.
+
+        :param encoder: xml type encoder
+        :param skip_empty: skip empty elements (elements without sub-elements, attributes and text, Nones)
+        :param kwargs: additional xml serialization arguments (except `encoding`)
+        :return: object xml representation
+        """
+
+        if 'encoding' in kwargs:
+            raise TypeError("to_xml_str() got an unexpected keyword argument 'encoding'")
+
+        xml = self.to_xml(encoder=encoder, skip_empty=skip_empty, encoding='unicode', **kwargs)
+        assert isinstance(xml, str)
+
+        return xml
+
+    @classmethod
+    def to_xml_many(
+            cls,
+            objs: Iterable['BaseXmlModel'],
+            *,
+            encoder: Optional[serializers.XmlEncoder] = None,
+            skip_empty: bool = False,
+            **kwargs: Any,
+    ) -> List[Union[str, bytes]]:
+        """
+        Serializes multiple objects of `cls` type to xml strings using a shared encoder.
+
+        :param objs: objects to be serialized
+        :param encoder: xml type encoder
+        :param skip_empty: skip empty elements (elements without sub-elements, attributes and text, Nones)
+        :param kwargs: additional xml serialization arguments
+        :return: objects xml representations
+        """
+
+        if not cls.__xml_meta__.ready:
+            raise cls.__xml_not_ready_error__()
+
+        encoder = encoder if encoder is not None else _DEFAULT_ENCODER
+
+        result = []
+        for obj in objs:
+            if not isinstance(obj, cls):
+                raise TypeError(f"object of type {obj.__class__.__name__} is not an instance of {cls.__name__}")
+
+            result.append(_tostring(obj.to_xml_tree(encoder=encoder, skip_empty=skip_empty), **kwargs))
+
+        return result
+
+
+# parametrized generic models cache, prevents serializers from being rebuilt on every `Model[T]` evaluation
+_GENERIC_MODELS_CACHE: 'weakref.WeakValueDictionary[Any, Type[BaseGenericXmlModel]]' = weakref.WeakValueDictionary()
+# models parametrized by `warmup`, the strong references keep them in the weak cache above
+_WARMED_UP_MODELS: Set[Type['BaseGenericXmlModel']] = set()
 
 
 class BaseGenericXmlModel(BaseXmlModel, pd.generics.GenericModel):
@@ -282,12 +593,19 @@ class BaseGenericXmlModel(BaseXmlModel, pd.generics.GenericModel):
     """
 
     def __class_getitem__(cls, params: Union[Type[Any], Tuple[Type[Any], ...]]) -> Type[Any]:
+        # type arguments are a part of the key since typing considers unions with different members order equal
+        args = get_args(params)
+        if len(args) == 2 and isinstance(args[0], list):
+            # Callable arguments are returned as a list which is not hashable
+            args = (tuple(args[0]), args[1])
+        cache_key = (cls, params, args)
+        if (model := _GENERIC_MODELS_CACHE.get(cache_key)) is not None:
+            return model
+
         model = super().__class_getitem__(params)
-        model.__xml_tag__ = cls.__xml_tag__
-        model.__xml_ns__ = cls.__xml_ns__
-        model.__xml_nsmap__ = cls.__xml_nsmap__
-        model.__xml_ns_attrs__ = cls.__xml_ns_attrs__
+        model.__xml_meta__ = cls.__xml_meta__
         model.__init_serializer__()
+        _GENERIC_MODELS_CACHE[cache_key] = model
 
         return model
 
@@ -295,20 +613,40 @@ class BaseGenericXmlModel(BaseXmlModel, pd.generics.GenericModel):
     def __init_serializer__(cls) -> None:
         # checks that the model is not generic
         if not getattr(cls, '__concrete__', True):
-            cls.__xml_serializer__ = None
+            cls.__xml_meta__ = dc.replace(cls.__xml_meta__, serializer=None, parse_obj=None, ready=False)
         else:
             super().__init_serializer__()
 
     @classmethod
-    def from_xml_tree(cls, root: etree.Element) -> 'BaseXmlModel':
-        """
-        Deserializes an xml element tree to an object of `cls` type.
+    def __xml_not_ready_error__(cls) -> errors.ModelError:
+        if not getattr(cls, '__concrete__', True):
+            return errors.ModelError(f"{cls.__name__} model is generic")
+        else:
+            return super().__xml_not_ready_error__()
 
-        :param root: xml element to deserialize the object from
-        :return: deserialized object
-        """
 
-        if cls.__xml_serializer__ is None:
-            raise errors.ModelError(f"{cls.__name__} model is generic")
+def iter_registered_models() -> Iterator[Type[BaseXmlModel]]:
+    """
+    Iterates over all the user defined xml models (including generic models parametrizations) that are still alive.
+    The library base models are not included.
+
+    :return: models iterator
+    """
+
+    return iter(list(_REGISTERED_MODELS))
+
+
+def warmup(*generic_specs: Tuple[Type[BaseGenericXmlModel], Any]) -> List[Type[BaseGenericXmlModel]]:
+    """
+    Parametrizes the provided generic models in advance so that the serializers are built
+    at application startup rather than on the first use.
+    The parametrized models are kept alive for the application lifetime.
+
+    :param generic_specs: pairs of a generic model and its type parameters
+    :return: parametrized models
+    """
+
+    models = [model[params] for model, params in generic_specs]  # type: ignore[index]
+    _WARMED_UP_MODELS.update(models)
 
-        return super().from_xml_tree(root)
+    return models
@@ -216,7 +216,7 @@ class PrimitiveTypeSerializerFactory:
         def __init__(
                 self, model: Type['pxml.BaseXmlModel'], model_field: pd.fields.ModelField, ctx: Serializer.Context,
         ):
-            ns_attrs = model.__xml_ns_attrs__
+            ns_attrs = model.__xml_meta__.ns_attrs
             name = ctx.entity_name or model_field.name
             ns = ctx.entity_ns or (ctx.parent_ns if ns_attrs else None)
             nsmap = ctx.parent_nsmap
@@ -292,9 +292,9 @@ class ModelSerializerFactory:
                 model: Type['pxml.BaseXmlModel'],
                 ctx: Serializer.Context,
         ):
-            name = ctx.entity_name or model.__xml_tag__ or model.__name__
-            ns = ctx.entity_ns or model.__xml_ns__
-            nsmap = merge_nsmaps(ctx.entity_nsmap, model.__xml_nsmap__, ctx.parent_nsmap)
+            name = ctx.entity_name or model.__xml_meta__.tag or model.__name__
+            ns = ctx.entity_ns or model.__xml_meta__.ns
+            nsmap = merge_nsmaps(ctx.entity_nsmap, model.__xml_meta__.nsmap, ctx.parent_nsmap)
             is_root = model.__custom_root_type__
             ctx = dc.replace(
                 ctx,
@@ -305,10 +305,12 @@ class ModelSerializerFactory:
 
             self.is_root = is_root
             self.element_name = QName.from_alias(tag=name, ns=ns, nsmap=nsmap).uri
-            self.field_serializers = {
-                field_name: self.build_field_serializer(model, model_subfield, ctx)
-                for field_name, model_subfield in model.__fields__.items()
-            }
+            # field names and serializers are stored in parallel tuples aligned by index
+            self.field_names = tuple(model.__fields__.keys())
+            self.field_serializers = tuple(
+                self.build_field_serializer(model, model_subfield, ctx)
+                for model_subfield in model.__fields__.values()
+            )
 
         def serialize(
                 self, element: Optional[etree.Element], value: Any, *, encoder: XmlEncoder, skip_empty: bool = False,
@@ -319,20 +321,47 @@ class ModelSerializerFactory:
             if element is None:
                 element = etree.Element(self.element_name)
 
-            for field_name, field_serializer in self.field_serializers.items():
+            for field_name, field_serializer in zip(self.field_names, self.field_serializers):
                 field_serializer.serialize(element, getattr(value, field_name), encoder=encoder, skip_empty=skip_empty)
 
             return element
 
         def deserialize(self, element: etree.Element) -> Any:
-            result = {
-                field_name: field_serializer.deserialize(element)
-                for field_name, field_serializer in self.field_serializers.items()
-            }
             if self.is_root:
-                return result['__root__']
+                # root models have the only __root__ field
+                return self.field_serializers[0].deserialize(element)
             else:
-                return result
+                return dict(zip(
+                    self.field_names,
+                    [field_serializer.deserialize(element) for field_serializer in self.field_serializers],
+                ))
+
+    class DefaultNsRootSerializer(RootSerializer):
+        """
+        Root serializer of a model with a default namespace.
+        Declares the default namespace on the document root element.
+        """
+
+        def __init__(
+                self,
+                model: Type['pxml.BaseXmlModel'],
+                ctx: Serializer.Context,
+        ):
+            super().__init__(model, ctx)
+
+            assert model.__xml_meta__.default_ns is not None, "model default namespace is not provided"
+            self.default_ns = model.__xml_meta__.default_ns
+
+        def serialize(
+                self, element: Optional[etree.Element], value: Any, *, encoder: XmlEncoder, skip_empty: bool = False,
+        ) -> Optional[etree.Element]:
+            if element is not None:
+                return super().serialize(element, value, encoder=encoder, skip_empty=skip_empty)
+
+            if (root := super().serialize(None, value, encoder=encoder, skip_empty=skip_empty)) is not None:
+                root.set('xmlns', self.default_ns)
+
+            return root
 
     class ElementSerializer(Serializer):
 
@@ -343,9 +372,9 @@ class ModelSerializerFactory:
                 ctx: Serializer.Context,
         ):
             field_name = model_field.name if model_field else None
-            name = ctx.entity_name or model.__xml_tag__ or field_name or model.__name__
-            ns = ctx.entity_ns or model.__xml_ns__
-            nsmap = merge_nsmaps(ctx.entity_nsmap, model.__xml_nsmap__, ctx.parent_nsmap)
+            name = ctx.entity_name or model.__xml_meta__.tag or field_name or model.__name__
+            ns = ctx.entity_ns or model.__xml_meta__.ns
+            nsmap = merge_nsmaps(ctx.entity_nsmap, model.__xml_meta__.nsmap, ctx.parent_nsmap)
 
             self.element_name = QName.from_alias(tag=name, ns=ns, nsmap=nsmap).uri
             self.model = model
@@ -353,14 +382,15 @@ class ModelSerializerFactory:
         def serialize(
                 self, element: etree.Element, value: Any, *, encoder: XmlEncoder, skip_empty: bool = False,
         ) -> Optional[etree.Element]:
-            assert self.model.__xml_serializer__ is not None, "model is partially initialized"
+            serializer = self.model.__xml_meta__.serializer
+            assert serializer is not None, "model is partially initialized"
 
             if value is None:
                 return None
 
             sub_element = etree.Element(self.element_name)
 
-            self.model.__xml_serializer__.serialize(sub_element, value, encoder=encoder, skip_empty=skip_empty)
+            serializer.serialize(sub_element, value, encoder=encoder, skip_empty=skip_empty)
 
             if not skip_empty or sub_element.text or sub_element.attrib or len(sub_element) != 0:
                 element.append(sub_element)
@@ -369,10 +399,11 @@ class ModelSerializerFactory:
                 return None
 
         def deserialize(self, element: etree.Element) -> Optional[Dict[str, Any]]:
-            assert self.model.__xml_serializer__ is not None, "model is partially initialized"
+            serializer = self.model.__xml_meta__.serializer
+            assert serializer is not None, "model is partially initialized"
 
             if (sub_element := element.find(self.element_name)) is not None:
-                return self.model.__xml_serializer__.deserialize(sub_element)
+                return serializer.deserialize(sub_element)
             else:
                 return None
 
@@ -384,18 +415,27 @@ class ModelSerializerFactory:
         def serialize(
                 self, element: etree.Element, value: Any, *, encoder: XmlEncoder, skip_empty: bool = False,
         ) -> Optional[etree.Element]:
-            assert self.model.__xml_serializer__ is not None, "model is partially initialized"
+            serializer = self.model.__xml_meta__.serializer
+            assert serializer is not None, "model is partially initialized"
 
-            return self.model.__xml_serializer__.serialize(element, value, encoder=encoder, skip_empty=skip_empty)
+            return serializer.serialize(element, value, encoder=encoder, skip_empty=skip_empty)
 
         def deserialize(self, element: etree.Element) -> Optional[Dict[str, Any]]:
-            assert self.model.__xml_serializer__ is not None, "model is partially initialized"
+            serializer = self.model.__xml_meta__.serializer
+            assert serializer is not None, "model is partially initialized"
 
-            return self.model.__xml_serializer__.deserialize(element)
+            return serializer.deserialize(element)
 
     @classmethod
     def from_model(cls, model: Type['pxml.BaseXmlModel']) -> 'RootSerializer':
-        return cls.RootSerializer(model, Serializer.Context(parent_is_root=True))
+        ctx = Serializer.Context(parent_is_root=True)
+
+        # the root serializer is specialized at the model creation time
+        # so that models without the default namespace don't check it on every serialization
+        if model.__xml_meta__.default_ns is not None:
+            return cls.DefaultNsRootSerializer(model, ctx)
+        else:
+            return cls.RootSerializer(model, ctx)
 
     @classmethod
     def build(
@@ -408,8 +448,8 @@ class ModelSerializerFactory:
         sub_model = model_field.type_
         ctx = dc.replace(
             ctx,
-            parent_ns=ctx.parent_ns or model.__xml_ns__,
-            parent_nsmap=merge_nsmaps(ctx.parent_nsmap, model.__xml_nsmap__),
+            parent_ns=ctx.parent_ns or model.__xml_meta__.ns,
+            parent_nsmap=merge_nsmaps(ctx.parent_nsmap, model.__xml_meta__.nsmap),
         )
 
         if field_location is Location.ELEMENT:
@@ -440,7 +480,7 @@ class MappingSerializerFactory:
             self.parent_ns = ns = ctx.entity_ns or ctx.parent_ns
             self.parent_nsmap = nsmap = merge_nsmaps(ctx.entity_nsmap, ctx.parent_nsmap)
             self.element_name = QName.from_alias(tag=name, ns=ns, nsmap=nsmap).uri
-            self.ns_attrs = model.__xml_ns_attrs__
+            self.ns_attrs = model.__xml_meta__.ns_attrs
 
     class AttributesSerializer(BaseSerializer):
         def serialize(
@@ -1,11 +1,13 @@
 import dataclasses as dc
 import re
 from collections import ChainMap
-from typing import Dict, Optional, cast
+from sys import intern
+from typing import Dict, Optional, Tuple, cast
 
 from .backend import etree
 
 NsMap = Dict[str, str]
+NsMapItems = Tuple[Tuple[str, str], ...]
 
 
 @dc.dataclass(frozen=True)
@@ -72,11 +74,32 @@ def merge_nsmaps(*maps: Optional[NsMap]) -> NsMap:
     return cast(NsMap, ChainMap(*(nsmap for nsmap in maps if nsmap)))
 
 
+def freeze_nsmap(nsmap: Optional[NsMap]) -> Optional[NsMapItems]:
+    """
+    Converts a namespace map into an immutable tuple of its interned items preserving the map order.
+
+    :param nsmap: namespace map
+    :return: namespace map items or `None` if the map is empty
+    """
+
+    return tuple((intern(prefix), intern(uri)) for prefix, uri in nsmap.items()) if nsmap else None
+
+
 def register_nsmap(nsmap: NsMap) -> None:
     """
     Registers namespaces prefixes from the map.
     """
 
-    for prefix, uri in nsmap.items():
+    if items := freeze_nsmap(nsmap):
+        register_nsmap_items(items)
+
+
+def register_nsmap_items(items: NsMapItems) -> None:
+    """
+    Registers namespaces prefixes from the frozen namespace map items.
+    The maps are registered every time since the last registered prefix of a namespace wins.
+    """
+
+    for prefix, uri in items:
         if prefix != '':  # skip default namespace
             etree.register_namespace(prefix, uri)
@@ -1,9 +1,12 @@
-from typing import Generic, TypeVar
+import gc
+import io
+from typing import Generic, TypeVar, Union
 
 import pytest
 from helpers import assert_xml_equal
+from lxml import etree
 
-from pydantic_xml import BaseGenericXmlModel, BaseXmlModel, attr, errors
+from pydantic_xml import BaseGenericXmlModel, BaseXmlModel, attr, element, errors, iter_registered_models, model, warmup
 
 
 def test_root_generic_model():
@@ -70,11 +73,85 @@ def test_generic_submodel():
     assert_xml_equal(actual_xml, xml)
 
 
-def test_generic_model_errors():
+def test_generic_model_cache():
     GenericType = TypeVar('GenericType')
 
-    with pytest.raises(errors.ModelError):
-        class GenericModel(BaseGenericXmlModel, Generic[GenericType], tag='model1'):
-            attr1: GenericType = attr()
+    class GenericModel(BaseGenericXmlModel, Generic[GenericType], tag='model1'):
+        attr1: GenericType = attr()
+
+    TestModel = GenericModel[int]
+    serializer = TestModel.__xml_meta__.serializer
+
+    assert GenericModel[int] is TestModel
+    assert GenericModel[int].__xml_meta__.serializer is serializer
+    assert GenericModel[float] is not TestModel
+
+    class UnionModel(BaseGenericXmlModel, Generic[GenericType], tag='model2'):
+        element1: GenericType = element()
+
+    xml = '<model2><element1>1</element1></model2>'
+
+    assert UnionModel[Union[int, str]].from_xml(xml).element1 == 1
+    assert UnionModel[Union[str, int]].from_xml(xml).element1 == '1'
+
+
+def test_generic_model_warmup():
+    GenericType = TypeVar('GenericType')
+
+    class GenericModel(BaseGenericXmlModel, Generic[GenericType], tag='model1'):
+        attr1: GenericType = attr()
+
+    warmup((GenericModel, int))
+    warmup((GenericModel, int))
+    gc.collect()
+
+    assert len([m for m in model._WARMED_UP_MODELS if m.__name__ == 'GenericModel[int]']) == 1
+
+    TestModel, = [
+        cached_model for (origin, params, _), cached_model in model._GENERIC_MODELS_CACHE.items()
+        if origin is GenericModel and params is int
+    ]
+    assert GenericModel[int] is TestModel
+    assert TestModel.__xml_meta__.ready
+    assert GenericModel in set(iter_registered_models())
+    assert TestModel in set(iter_registered_models())
+    assert BaseGenericXmlModel not in set(iter_registered_models())
+
+
+def test_generic_model_errors():
+    GenericType1 = TypeVar('GenericType1')
+    GenericType2 = TypeVar('GenericType2')
+
+    with pytest.raises(errors.ModelError, match='model is generic'):
+        class GenericModel(BaseGenericXmlModel, Generic[GenericType1, GenericType2], tag='model1'):
+            attr1: GenericType1 = attr()
+            attr2: GenericType2 = attr()
 
         GenericModel.from_xml('<model1/>')
+
+    PartialModel = GenericModel[int, GenericType2]
+
+    for model_cls in (GenericModel, PartialModel):
+        with pytest.raises(errors.ModelError, match='model is generic'):
+            model_cls.from_xml('<model1/>')
+
+        with pytest.raises(errors.ModelError, match='model is generic'):
+            model_cls.from_xml_bytes(b'<model1/>')
+
+        with pytest.raises(errors.ModelError, match='model is generic'):
+            model_cls.from_xml_tree(etree.fromstring('<model1/>'))
+
+        with pytest.raises(errors.ModelError, match='model is generic'):
+            model_cls.from_xml_many(['<model1/>'])
+
+        with pytest.raises(errors.ModelError, match='model is generic'):
+            model_cls.from_xml_stream(io.BytesIO(b'<model1/>'))
+
+        with pytest.raises(errors.ModelError, match='model is generic'):
+            model_cls(attr1=1, attr2=2).to_xml()
+
+        with pytest.raises(errors.ModelError, match='model is generic'):
+            model_cls(attr1=1, attr2=2).to_xml_tree()
+
+        with pytest.raises(errors.ModelError, match='model is generic'):
+            model_cls.to_xml_many([model_cls(attr1=1, attr2=2)])
@@ -1,8 +1,11 @@
+import io
 from typing import Dict, List, Optional, Tuple
 
+import pydantic as pd
+import pytest
 from helpers import assert_xml_equal
 
-from pydantic_xml import BaseXmlModel, attr, element, wrapped
+from pydantic_xml import BaseXmlModel, attr, backend, element, model, serializers, wrapped
 
 
 def test_xml_declaration():
@@ -22,6 +25,54 @@ def test_xml_declaration():
     assert_xml_equal(actual_xml, xml.encode())
 
 
+def test_str_bytes_entry_points():
+    class TestModel(BaseXmlModel, tag='model'):
+        element1: str = element()
+
+    xml = '''<?xml version="1.0" encoding="iso-8859-1"?>
+    <model><element1>élément</element1></model>
+    '''
+    expected_obj = TestModel(element1='élément')
+
+    assert TestModel.from_xml_str(xml) == expected_obj
+    assert TestModel.from_xml(xml) == expected_obj
+    assert TestModel.from_xml_bytes(xml.encode('iso-8859-1')) == expected_obj
+    assert TestModel.from_xml(xml.encode('iso-8859-1')) == expected_obj
+
+    actual_xml = expected_obj.to_xml_str()
+    assert isinstance(actual_xml, str)
+    assert_xml_equal(actual_xml, '<model><element1>élément</element1></model>')
+
+    actual_xml = expected_obj.to_xml_bytes(encoding='utf-8')
+    assert isinstance(actual_xml, bytes)
+    assert_xml_equal(actual_xml, '<model><element1>élément</element1></model>'.encode())
+
+    assert TestModel.from_xml_many([xml, xml.encode('iso-8859-1')]) == [expected_obj, expected_obj]
+
+    with pytest.raises(TypeError):
+        expected_obj.to_xml_str(encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        expected_obj.to_xml_bytes(encoding='unicode')
+
+
+def test_entities_not_resolved():
+    class TestModel(BaseXmlModel, tag='model'):
+        element1: str = element(default='')
+
+    xml = '''<!DOCTYPE model [<!ENTITY entity1 "value">]>
+    <model><element1>&entity1;</element1></model>
+    '''
+
+    actual_obj = TestModel.from_xml(xml.encode())
+
+    # lxml parser doesn't resolve entities, the standard library parser resolves internal ones
+    if backend.is_lxml:
+        assert actual_obj == TestModel(element1='')
+    else:
+        assert actual_obj == TestModel(element1='value')
+
+
 def test_skip_empty():
     class TestSubModel(BaseXmlModel, tag='model'):
         text: Optional[str]
@@ -105,3 +156,205 @@ def test_defaults():
     expected_xml = '<model attr1="1"><element1>1</element1></model>'
     actual_xml = actual_obj.to_xml(skip_empty=True)
     assert_xml_equal(actual_xml, expected_xml.encode())
+
+
+def test_batch():
+    class TestModel(BaseXmlModel, tag='model'):
+        attr1: int = attr()
+        element1: str = element()
+
+    xmls = [
+        '<model attr1="1"><element1>value1</element1></model>',
+        '<model attr1="2"><element1>value2</element1></model>',
+    ]
+
+    actual_objs = TestModel.from_xml_many(xml.encode() for xml in xmls)
+    expected_objs = [
+        TestModel(attr1=1, element1='value1'),
+        TestModel(attr1=2, element1='value2'),
+    ]
+    assert actual_objs == expected_objs
+
+    for actual_xml, expected_xml in zip(TestModel.to_xml_many(actual_objs), xmls):
+        assert_xml_equal(actual_xml, expected_xml.encode())
+
+    with pytest.raises(pd.ValidationError):
+        TestModel.from_xml_many(['<model attr1="1"><element1>value1</element1></model>', '<model attr1="a"/>'])
+
+    class OtherModel(BaseXmlModel, tag='other'):
+        attr1: int = attr()
+
+    with pytest.raises(TypeError):
+        TestModel.to_xml_many([OtherModel(attr1=1)])
+
+
+def test_parse_obj_override():
+    class TestModel(BaseXmlModel, tag='model'):
+        element1: str = element()
+
+        @classmethod
+        def parse_obj(cls, obj):
+            return super().parse_obj(dict(obj, element1=obj['element1'].upper()))
+
+    xml = '<model><element1>value</element1></model>'
+    expected_obj = TestModel(element1='VALUE')
+
+    assert TestModel.from_xml(xml) == expected_obj
+    assert TestModel.from_xml_many([xml]) == [expected_obj]
+
+
+def test_refresh_backend(monkeypatch):
+    class TestEncoder(serializers.XmlEncoder):
+        def encode(self, obj):
+            return super().encode(obj).upper()
+
+    class TestModel(BaseXmlModel, tag='model'):
+        element1: str = element()
+
+    monkeypatch.setattr(serializers, 'DEFAULT_ENCODER', TestEncoder())
+    model.refresh_backend()
+    try:
+        actual_xml = TestModel(element1='value').to_xml()
+    finally:
+        monkeypatch.undo()
+        model.refresh_backend()
+
+    assert_xml_equal(actual_xml, b'<model><element1>VALUE</element1></model>')
+
+    monkeypatch.setattr(backend, 'tostring', lambda element, **kwargs: b'<patched/>')
+    model.refresh_backend()
+    try:
+        actual_xml = TestModel(element1='value').to_xml()
+    finally:
+        monkeypatch.undo()
+        model.refresh_backend()
+
+    assert actual_xml == b'<patched/>'
+
+
+def test_skip_validation():
+    class TestSubModel(BaseXmlModel, tag='submodel'):
+        attr1: str = attr()
+
+    class TestModel(BaseXmlModel, tag='model', skip_validation=True):
+        attr1: int = attr()
+        element1: str = element()
+        submodel: TestSubModel
+
+    xml = '''
+    <model attr1="1">
+        <element1>value</element1>
+        <submodel attr1="value"/>
+    </model>
+    '''
+
+    actual_obj = TestModel.from_xml(xml)
+    assert actual_obj.attr1 == '1'
+    assert actual_obj.element1 == 'value'
+    assert actual_obj.submodel == TestSubModel(attr1='value')
+
+    actual_xml = actual_obj.to_xml()
+    assert_xml_equal(actual_xml, xml)
+
+    [actual_obj] = TestModel.from_xml_many([xml])
+    assert actual_obj.attr1 == '1'
+
+    actual_xml = actual_obj.to_xml()
+    assert_xml_equal(actual_xml, xml)
+
+
+def test_skip_validation_recursive():
+    class TestModel(BaseXmlModel, tag='model', skip_validation=True):
+        attr1: str = attr()
+        submodels: List['TestModel'] = element(tag='model', default_factory=list)
+        pair: Optional[Tuple[int, 'TestModel']] = element(tag='pair')
+
+    xml = '''
+    <model attr1="1">
+        <model attr1="2"/>
+        <model attr1="3">
+            <model attr1="4"/>
+        </model>
+        <pair>5</pair>
+        <pair attr1="6"/>
+    </model>
+    '''
+
+    actual_obj = TestModel.from_xml(xml)
+    assert actual_obj.submodels[1].submodels[0].attr1 == '4'
+    assert actual_obj.pair[1].attr1 == '6'
+
+    actual_xml = actual_obj.to_xml()
+    assert_xml_equal(actual_xml, xml)
+
+
+def test_stream():
+    class TestModel(BaseXmlModel, tag='record', ns='tst', nsmap={'tst': 'http://test.org'}):
+        attr1: int = attr()
+        element1: str = element()
+
+    xml = '''
+    <tst:records xmlns:tst="http://test.org">
+        <tst:record attr1="1"><tst:element1>value1</tst:element1></tst:record>
+        <tst:record attr1="2"><tst:element1>value2</tst:element1></tst:record>
+        <tst:record attr1="3"><tst:element1>value3</tst:element1></tst:record>
+    </tst:records>
+    '''
+
+    actual_objs = list(TestModel.from_xml_stream(io.BytesIO(xml.encode())))
+    expected_objs = [
+        TestModel(attr1=1, element1='value1'),
+        TestModel(attr1=2, element1='value2'),
+        TestModel(attr1=3, element1='value3'),
+    ]
+    assert actual_objs == expected_objs
+
+
+def test_stream_recursive():
+    class Directory(BaseXmlModel, tag='directory'):
+        name: str = element()
+        dirs: List['Directory'] = element(tag='directory', default_factory=list)
+
+    xml = '''
+    <root>
+        <directory>
+            <name>a</name>
+            <directory><name>b</name></directory>
+            <directory><name>c</name><directory><name>d</name></directory></directory>
+        </directory>
+        <directory><name>e</name></directory>
+    </root>
+    '''
+
+    actual_objs = list(Directory.from_xml_stream(io.BytesIO(xml.encode())))
+    expected_objs = [
+        Directory(
+            name='a',
+            dirs=[
+                Directory(name='b'),
+                Directory(name='c', dirs=[Directory(name='d')]),
+            ],
+        ),
+        Directory(name='e'),
+    ]
+    assert actual_objs == expected_objs
+
+
+def test_to_xml_tree_override():
+    class TestModel(BaseXmlModel, tag='model'):
+        element1: str = element()
+
+        def to_xml_tree(self, **kwargs):
+            root = super().to_xml_tree(**kwargs)
+            root.set('attr1', 'value')
+
+            return root
+
+    xml = '''
+    <model attr1="value">
+        <element1>value</element1>
+    </model>
+    '''
+
+    actual_xml = TestModel(element1='value').to_xml()
+    assert_xml_equal(actual_xml, xml)
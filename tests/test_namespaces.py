@@ -39,6 +39,43 @@ def test_default_namespaces():
     assert_xml_equal(actual_xml, xml)
 
 
+def test_namespace_prefix_redeclaration():
+    class TestModel1(BaseXmlModel, tag='model1', ns='tst1', nsmap={'tst1': 'http://test-redeclaration.org'}):
+        pass
+
+    class TestModel2(BaseXmlModel, tag='model2', ns='tst2', nsmap={'tst2': 'http://test-redeclaration.org'}):
+        pass
+
+    class TestModel3(BaseXmlModel, tag='model3', ns='tst1', nsmap={'tst1': 'http://test-redeclaration.org'}):
+        pass
+
+    actual_xml = TestModel3().to_xml()
+    # the last declared prefix is used
+    assert actual_xml.startswith(b'<tst1:model3 xmlns:tst1="http://test-redeclaration.org"')
+
+
+def test_root_default_namespace():
+    class TestModel(BaseXmlModel, tag='model', nsmap={'': 'http://test1.org'}):
+        element1: str = element()
+
+    xml = '''
+    <model xmlns="http://test1.org">
+        <element1>value</element1>
+    </model>
+    '''
+
+    actual_obj = TestModel.from_xml(xml)
+    expected_obj = TestModel(element1='value')
+
+    assert actual_obj == expected_obj
+
+    actual_xml = actual_obj.to_xml()
+    assert_xml_equal(actual_xml, xml)
+
+    actual_tree = actual_obj.to_xml_tree()
+    assert actual_tree.get('xmlns') == 'http://test1.org'
+
+
 @pytest.mark.parametrize(
     'model_ns, element_ns, expected_model_ns, expected_element_ns',
     [